@@ -1,10 +1,207 @@
 import inspect
+import math
+import operator
+import reprlib
 import sys
 import types
-from collections.abc import Sized
+from functools import lru_cache
 from typing import Optional
+from weakref import WeakKeyDictionary
 
-import pandas as pd
+# Heavy imports (pandas, IPython, numba) are deferred to first use so that
+# `import var_inspector` stays cheap for code that only constructs an
+# inspector; pandas alone adds 100-200ms of cold-start latency.
+pd = None  # resolved by _get_pd()
+_np = None  # resolved by _get_np()
+_display = None  # resolved by _get_display()
+_summarize = None  # resolved by _get_summarize()
+
+
+def _get_pd():
+    """Import pandas on first use and bind it as the module-level ``pd``."""
+    global pd
+    if pd is None:
+        import pandas
+
+        pd = pandas
+    return pd
+
+
+def _get_np():
+    """Import numpy on first use. Called only from the display paths, where
+    pandas has already loaded numpy, so this is a sys.modules hit."""
+    global _np
+    if _np is None:
+        import numpy
+
+        _np = numpy
+    return _np
+
+
+def _get_display():
+    """Resolve the dataframe renderer on first use: IPython's display()
+    when available, plain print otherwise."""
+    global _display
+    if _display is None:
+        try:
+            from IPython.display import display as display_fn
+        except ImportError:
+            display_fn = print
+        _display = display_fn
+    return _display
+
+
+# repr() of a large numeric ndarray walks every element through pandas/numpy
+# formatting even though only a preview is shown; arrays above this size get
+# a one-line stats summary instead.
+_SUMMARY_MIN_SIZE = 10_000
+
+
+def _summarize_impl(arr):
+    """Single-pass min/max/mean/nan-count over a 1-D numeric array."""
+    lo = math.inf
+    hi = -math.inf
+    total = 0.0
+    nans = 0
+    for x in arr:
+        if x != x:
+            nans += 1
+        else:
+            if x < lo:
+                lo = x
+            if x > hi:
+                hi = x
+            total += x
+    n = arr.size - nans
+    mean = total / n if n else math.nan
+    return lo, hi, mean, nans
+
+
+def _get_summarize():
+    """Build the array summarizer on first use: njit-compiled when numba is
+    installed, vectorized numpy reductions otherwise."""
+    global _summarize
+    if _summarize is None:
+        try:  # numba is optional; numpy reductions are the fallback
+            from numba import njit
+        except ImportError:
+            njit = None
+        if njit is not None:
+            _summarize = njit(cache=True)(_summarize_impl)
+        else:
+            import numpy as np  # already loaded: summaries only run on ndarrays
+
+            def _summarize_fallback(arr):
+                # Vectorized; a pure-Python element loop would be slower
+                # than the repr it replaces.
+                nans = int(np.isnan(arr).sum()) if arr.dtype.kind == "f" else 0
+                if arr.size == nans:
+                    return math.nan, math.nan, math.nan, nans
+                return (
+                    float(np.nanmin(arr)),
+                    float(np.nanmax(arr)),
+                    float(np.nanmean(arr)),
+                    nans,
+                )
+
+            _summarize = _summarize_fallback
+    return _summarize
+
+
+# Reciprocal of one megabyte, precomputed so size formatting is a single
+# multiply instead of a division per row.
+_MB = 1.0 / (1024**2)
+
+
+@lru_cache(maxsize=4096)
+def _format_size_mb(size_bytes: int) -> str:
+    """Format a byte count as megabytes with two decimals, memoized since
+    attribute rows overwhelmingly repeat the same handful of sizes."""
+    return f"{size_bytes * _MB:.2f}"
+
+
+# Maps id(module) -> module name so repeated overviews of objects from the
+# same module never rescan sys.modules (inspect.getmodule does a linear walk
+# whenever the filename cache misses, which is costly in notebook sessions).
+_module_name_cache: dict[int, str] = {}
+
+
+@lru_cache(maxsize=None)
+def _module_info_for(cls: type, module_attr: Optional[str]) -> tuple[str, str]:
+    """Resolve (module name, file path) for objects of ``cls`` declared in
+    ``module_attr``, memoized so only the first lookup per type/module pair
+    pays the resolution cost."""
+    module = sys.modules.get(module_attr) if module_attr else None
+    if module is None:
+        return "Unknown module", "File not applicable"
+    module_name = _module_name_cache.get(id(module))
+    if module_name is None:
+        module_name = _module_name_cache.setdefault(id(module), module.__name__)
+    try:
+        file_path = inspect.getfile(module)
+    except TypeError:
+        file_path = "File not applicable"
+    return module_name, file_path
+
+
+@lru_cache(maxsize=None)
+def _callable_info(func) -> tuple[str, str]:
+    """Memoized (signature, doc) lookup for a callable. Built-in callables
+    are short-circuited to "N/A" since inspect.signature reliably raises
+    ValueError for them."""
+    doc = inspect.getdoc(func) or "No documentation available"
+    if isinstance(func, (types.BuiltinFunctionType, types.BuiltinMethodType)):
+        return "N/A", doc
+    try:
+        sig = str(inspect.signature(func))
+    except ValueError:
+        sig = "N/A"
+    return sig, doc
+
+
+# Per-type attribute name cache: the class-level portion of dir(obj) is
+# invariant, so the MRO walk is done once per type. Weak keys let classes
+# defined interactively (and later discarded) be collected.
+_type_attr_cache: "WeakKeyDictionary[type, tuple[tuple[str, ...], tuple[str, ...]]]" = (
+    WeakKeyDictionary()
+)
+
+
+def _class_attr_names(cls: type) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    """Return (public names, all names) merged across ``cls.__mro__``,
+    cached per type."""
+    cached = _type_attr_cache.get(cls)
+    if cached is None:
+        names = set()
+        for klass in cls.__mro__:
+            names.update(vars(klass))
+        cached = (
+            tuple(sorted(n for n in names if not n.startswith("_"))),
+            tuple(sorted(names)),
+        )
+        try:
+            _type_attr_cache[cls] = cached
+        except TypeError:  # cls does not support weak references
+            pass
+    return cached
+
+
+def _callable_info_for(value) -> tuple[str, str]:
+    """Look up (signature, doc) for ``value``, caching on the underlying
+    function for bound methods so every instance of a class shares one
+    cache entry."""
+    target = getattr(value, "__func__", None)
+    if target is None:
+        # Bound builtin/slot-wrapper methods have no __func__; caching them
+        # would strongly reference __self__ and pin every inspected object
+        # in memory forever, so compute their row without caching.
+        if getattr(value, "__self__", None) is not None:
+            return _callable_info.__wrapped__(value)
+        target = value
+    try:
+        return _callable_info(target)
+    except TypeError:  # unhashable callable; compute without caching
+        return _callable_info.__wrapped__(target)
 
 
 class VarInspector:
@@ -43,6 +240,19 @@ class VarInspector:
         ```
     """
 
+    # No per-instance __dict__: shrinks each inspector by ~100 bytes, speeds
+    # up attribute reads in the display loops, and turns attribute typos
+    # into immediate AttributeErrors.
+    __slots__ = (
+        "exclude_names",
+        "descending",
+        "max_str_length",
+        "max_rows",
+        "_exclude_prefixes",
+        "_excluded_types",
+        "_repr",
+    )
+
     def __init__(
         self,
         exclude_names: Optional[set[str]] = None,
@@ -53,26 +263,66 @@ class VarInspector:
         if exclude_names is None:
             exclude_names = {"In", "Out", "_", "exit", "quit", "get_ipython"}
         self.exclude_names = exclude_names
+        # Precomputed so the globals filter runs one C-level
+        # str.startswith(tuple) call instead of a Python-level any() loop,
+        # and isinstance() doesn't rebuild its type tuple per variable.
+        self._exclude_prefixes = tuple(exclude_names)
+        self._excluded_types = (
+            types.ModuleType,
+            types.FunctionType,
+            types.BuiltinFunctionType,
+        )
         self.descending = (
             descending  # Boolean to determine if sorting in descending order
         )
         self.max_str_length = max_str_length
-        self.max_rows = (
-            max_rows if max_rows is not None else pd.get_option("display.max_rows")
-        )
+        # Bounded repr: pandas truncates cells to max_str_length anyway, so
+        # building the full repr of large containers is wasted work.
+        self._repr = reprlib.Repr()
+        self._repr.maxstring = max_str_length
+        self._repr.maxother = max_str_length
+        self._repr.maxlist = 20
+        self._repr.maxdict = 10
+        if max_rows is None:  # only touch the option registry when needed
+            max_rows = _get_pd().get_option("display.max_rows")
+        self.max_rows = max_rows
 
-    def _format_value(self, value) -> str:
-        return repr(value)
+    def _show(self, df):
+        """Render a dataframe via IPython's rich display when available,
+        otherwise print with to_string to skip the HTML formatter."""
+        if _get_display() is print:
+            print(
+                df.to_string(max_colwidth=self.max_str_length, max_rows=self.max_rows)
+            )
+        else:
+            _display(df)
 
-    def _get_size_mb(self, obj):
-        """Estimate the size of a Python object in megabytes."""
-        return sys.getsizeof(obj) / (1024**2)
+    def _format_value(self, value) -> str:
+        if isinstance(value, str) and len(value) > self.max_str_length:
+            return repr(value[: self.max_str_length]) + "..."
+        # If numpy was never imported there can be no ndarrays to summarize,
+        # so look it up in sys.modules rather than importing it.
+        np = sys.modules.get("numpy")
+        if (
+            np is not None
+            and isinstance(value, np.ndarray)
+            and value.dtype.kind in "fiu"
+            and value.size > _SUMMARY_MIN_SIZE
+        ):
+            lo, hi, mean, nans = _get_summarize()(np.ravel(value))
+            return (
+                f"ndarray shape={value.shape} dtype={value.dtype} "
+                f"min={lo:.6g} max={hi:.6g} mean={mean:.6g} nan={nans}"
+            )
+        return self._repr.repr(value)
 
     def _get_length(self, obj):
         """Get the length of an object if applicable."""
-        if isinstance(obj, Sized):
-            return len(obj)
-        return "-"
+        # Probe __len__ on the type directly; this skips the ABC
+        # __instancecheck__ machinery of isinstance(obj, Sized) and mirrors
+        # CPython's own special-method lookup.
+        len_fn = getattr(type(obj), "__len__", None)
+        return len_fn(obj) if len_fn is not None else "-"
 
     def __call__(self, var=None, include_advanced_details=False):
         """
@@ -82,11 +332,20 @@ class VarInspector:
             var (Optional): Specific variable to inspect. If None, display global variables.
             include_advanced_details (bool): Whether to include all the cases (callables, modules, hidden attributes, special objects) in the display.
         """
-        original_max_colwidth = pd.get_option("display.max_colwidth")
-        original_max_rows = pd.get_option("display.max_rows")
-        pd.set_option("display.max_colwidth", self.max_str_length)
-        pd.set_option("display.max_rows", self.max_rows)
-        try:
+        pd = _get_pd()
+        # option_context saves and restores in one registry walk; mathjax
+        # and borders are switched off to trim HTML generation work, as
+        # neither is useful for these plain-text tables.
+        with pd.option_context(
+            "display.max_colwidth",
+            self.max_str_length,
+            "display.max_rows",
+            self.max_rows,
+            "display.html.use_mathjax",
+            False,
+            "display.html.border",
+            0,
+        ):
             if var is None:
                 print("User-defined and basic type global variables:")
                 self._display_globals(include_advanced_details=include_advanced_details)
@@ -97,35 +356,31 @@ class VarInspector:
                 self._display_attributes(
                     var, include_advanced_details=include_advanced_details
                 )
-        finally:
-            pd.set_option("display.max_colwidth", original_max_colwidth)
-            pd.set_option("display.max_rows", original_max_rows)
 
     def _display_overview(self, obj):
         """Display an overview of the object."""
-        try:
-            module = inspect.getmodule(obj)
-            module_name = module.__name__ if module else "Unknown module"
-            source_file = (
-                inspect.getsourcefile(obj)
-                if hasattr(obj, "__code__")
-                else "Source file not available"
+        if inspect.ismodule(obj):
+            # Modules carry no __module__ attribute; they are their own.
+            module_name = obj.__name__
+            try:
+                file_path = inspect.getfile(obj)
+            except TypeError:
+                file_path = "File not applicable"
+        else:
+            module_name, file_path = _module_info_for(
+                type(obj), getattr(obj, "__module__", None)
             )
-        except TypeError:
-            source_file = "Source file not applicable"
-
-        try:
-            file_path = inspect.getfile(obj)
-        except TypeError:
-            file_path = "File not applicable"
-
-        try:
-            source_lines = (
-                inspect.getsourcelines(obj)
-                if hasattr(obj, "__code__")
-                else ("Not applicable", None)
-            )
-        except OSError:
+        if hasattr(obj, "__code__"):
+            try:
+                source_file = inspect.getsourcefile(obj) or "Source file not available"
+            except TypeError:
+                source_file = "Source file not applicable"
+            try:
+                source_lines = inspect.getsourcelines(obj)
+            except OSError:
+                source_lines = ("Not applicable", None)
+        else:
+            source_file = "Source file not available"
             source_lines = ("Not applicable", None)
 
         overview_data = {
@@ -140,88 +395,131 @@ class VarInspector:
                     else "No source line info"
                 )
             ],
-            "Size (MB)": [f"{self._get_size_mb(obj):.2f}"],
+            "Size (MB)": [_format_size_mb(type(obj).__sizeof__(obj))],
             "Doc": [inspect.getdoc(obj) or "No documentation available"],
         }
         df_overview = pd.DataFrame(overview_data)
         df_overview = df_overview.T  # Transpose to display as vertical records
         df_overview.columns = ["Value"]  # Rename columns after transpose
-        display(df_overview)
+        self._show(df_overview)
+
+    def _iter_rows(self, sorted_vars):
+        """Yield one display row per (sort key, name, value) tuple, so rows
+        flow straight into from_records without an intermediate list."""
+        # Notebook globals repeat the same few types heavily; cache the
+        # __name__ lookup per type for the duration of the call.
+        type_names = {}
+        for _, name, value in sorted_vars:
+            t = type(value)
+            yield (
+                name,
+                type_names.get(t) or type_names.setdefault(t, t.__name__),
+                _format_size_mb(t.__sizeof__(value)),
+                self._get_length(value),
+                self._format_value(value),
+            )
 
     def _display_globals(self, include_advanced_details=False):
-        data = []
-        global_vars = {
-            name: value
-            for name, value in globals().items()
-            if (
-                include_advanced_details
-                or (
-                    not any(name.startswith(exclude) for exclude in self.exclude_names)
-                    and not isinstance(
-                        value,
-                        (
-                            types.ModuleType,
-                            types.FunctionType,
-                            types.BuiltinFunctionType,
-                        ),
-                    )
-                    and not name.endswith("_")
+        # Two frames up: _display_globals -> __call__ -> caller. This picks
+        # up the caller's (e.g. notebook) globals rather than this module's.
+        caller_globals = sys._getframe(2).f_globals
+        sorted_vars = []
+        excluded = {}  # per-type memo of the isinstance check below
+        for name, value in caller_globals.items():
+            t = type(value)
+            is_excluded = excluded.get(t)
+            if is_excluded is None:
+                is_excluded = excluded.setdefault(
+                    t, issubclass(t, self._excluded_types)
                 )
-            )
-        }
-        sorted_vars = sorted(
-            global_vars.items(), key=lambda x: x[0].lower(), reverse=self.descending
-        )
-        for name, value in sorted_vars:
-            data.append(
-                {
-                    "Name": name,
-                    "Type": type(value).__name__,
-                    "Size (MB)": f"{self._get_size_mb(value):.2f}",
-                    "Len": self._get_length(value),
-                    "Value": self._format_value(value),
-                }
-            )
-        df = pd.DataFrame(data)
-        display(df)
+            if include_advanced_details or (
+                not name.startswith(self._exclude_prefixes)
+                and not is_excluded
+                and not name.endswith("_")
+            ):
+                sorted_vars.append((name.lower(), name, value))
+        sorted_vars.sort(key=operator.itemgetter(0), reverse=self.descending)
+        # Only max_rows rows can be displayed; build one extra so pandas
+        # still renders its truncation marker, and stream them into one
+        # preallocated object array so pandas sees a ready-made block
+        # instead of growing per-row storage.
+        np = _get_np()
+        n = min(len(sorted_vars), self.max_rows + 1)
+        arr = np.empty((n, 5), dtype=object)
+        for i, row in enumerate(self._iter_rows(sorted_vars[:n])):
+            arr[i] = row
+        df = pd.DataFrame(arr, columns=["Name", "Type", "Size (MB)", "Len", "Value"])
+        self._show(df)
 
     def _display_attributes(self, obj, include_advanced_details=False):
-        data = []
-        for attr in dir(obj):
-            if include_advanced_details or not attr.startswith("_"):
-                try:
-                    value = getattr(obj, attr)
-                    if callable(value):
-                        doc = inspect.getdoc(value) or "No documentation available"
-                        try:
-                            sig = str(inspect.signature(value))
-                        except ValueError:
-                            sig = "N/A"
-                        data.append(
-                            {
-                                "Name": attr,
-                                "Type": "Method",
-                                "Signature": sig,
-                                "Size (MB)": "-",
-                                "Len": "-",
-                                "Value": doc if doc else "No documentation available",
-                            }
-                        )
-                    else:
-                        data.append(
-                            {
-                                "Name": attr,
-                                "Type": type(value).__name__,
-                                "Signature": "-",
-                                "Size (MB)": f"{self._get_size_mb(value):.2f}",
-                                "Len": self._get_length(value),
-                                "Value": self._format_value(value),
-                            }
-                        )
-                except AttributeError:
-                    print(f"Attribute {attr} is not accessible.")
-        df = pd.DataFrame(data)
-        display(df)
+        np = _get_np()
+        # Only max_rows rows can be displayed, so rows stream into two
+        # preallocated object arrays (methods group ahead of attributes) and
+        # the attribute walk stops once the budget is spent. The budget is
+        # one past max_rows so pandas still renders its truncation marker.
+        budget = self.max_rows + 1
+        method_arr = np.empty((budget, 6), dtype=object)
+        attr_arr = np.empty((budget, 6), dtype=object)
+        n_methods = 0
+        n_attrs = 0
+        type_names = {}  # per-call memo of type(value).__name__
+        # Class-level names come from the per-type cache rather than a fresh
+        # dir() merge; only instance-specific names are collected per call.
+        # getattr on discarded dunder/private names can run arbitrary
+        # property code or raise, so filtered names are never probed.
+        # The cache only matches dir() for plain instances: inspecting a
+        # class must walk the class's own MRO (not its metaclass's), and
+        # custom __dir__ implementations (e.g. pandas DataFrames exposing
+        # column names) must be honored, so both fall back to dir().
+        if isinstance(obj, type) or type(obj).__dir__ is not object.__dir__:
+            all_names = dir(obj)
+            if include_advanced_details:
+                names = all_names
+            else:
+                names = [n for n in all_names if not n.startswith("_")]
+        else:
+            public_names, all_names = _class_attr_names(type(obj))
+            names = all_names if include_advanced_details else public_names
+            instance_dict = getattr(obj, "__dict__", None)
+            if instance_dict:
+                extra = [
+                    n
+                    for n in instance_dict
+                    if (include_advanced_details or not n.startswith("_"))
+                    and n not in names
+                ]
+                if extra:
+                    names = sorted(set(names).union(extra))
+        for attr in names:
+            if n_methods + n_attrs == budget:
+                break
+            try:
+                value = getattr(obj, attr)
+            except Exception:
+                # Descriptors may raise arbitrary errors on access, e.g.
+                # numpy's ndarray.mT raises ValueError for 1-D arrays.
+                print(f"Attribute {attr} is not accessible.")
+                continue
+            if callable(value):
+                sig, doc = _callable_info_for(value)
+                method_arr[n_methods] = (attr, "Method", sig, "-", "-", doc)
+                n_methods += 1
+            else:
+                t = type(value)
+                attr_arr[n_attrs] = (
+                    attr,
+                    type_names.get(t) or type_names.setdefault(t, t.__name__),
+                    "-",
+                    _format_size_mb(t.__sizeof__(value)),
+                    self._get_length(value),
+                    self._format_value(value),
+                )
+                n_attrs += 1
+        df = pd.DataFrame(
+            np.concatenate((method_arr[:n_methods], attr_arr[:n_attrs])),
+            columns=["Name", "Type", "Signature", "Size (MB)", "Len", "Value"],
+        )
+        self._show(df)
 
 
 # default instance